@@ -0,0 +1,232 @@
+from typing import Any, Dict, List, Optional, Type
+
+from aiobotocore.session import get_session
+
+from .dbapi import BaseCursor, Error, paramstyle
+from .exceptions import DataAPIError
+from .pydataapi import (
+    MAX_RECORDS,
+    BaseDataAPI,
+    Result,
+    UpdateResults,
+    _check_batch_size,
+    _slice_parameter_sets,
+)
+
+
+class AsyncDataAPI(BaseDataAPI):
+    __slots__ = ()
+
+    async def begin(
+        self, database: Optional[str] = None, schema: Optional[str] = None
+    ) -> str:
+        response: Dict[str, str] = await self._begin_transaction(
+            **self._begin_kwargs(database, schema)
+        )
+        self._transaction_id = response['transactionId']
+
+        return response['transactionId']
+
+    async def commit(self, transaction_id: Optional[str] = None) -> str:
+        response: Dict[str, str] = await self._commit_transaction(
+            **self._end_transaction_kwargs(transaction_id)
+        )
+        self._transaction_status = response['transactionStatus']
+
+        return self._transaction_status
+
+    async def rollback(self, transaction_id: Optional[str] = None) -> str:
+        response: Dict[str, str] = await self._rollback_transaction(
+            **self._end_transaction_kwargs(transaction_id)
+        )
+        self._transaction_status = response['transactionStatus']
+
+        return self._transaction_status
+
+    async def execute(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        transaction_id: Optional[str] = None,
+        continue_after_timeout: bool = True,
+        database: Optional[str] = None,
+    ) -> Result:
+        return Result(
+            await self._execute_statement(
+                **self._execute_kwargs(
+                    query, parameters, transaction_id, continue_after_timeout, database
+                )
+            )
+        )
+
+    async def batch_execute(
+        self,
+        query: str,
+        parameter_sets: Optional[List[Dict[str, Any]]],
+        transaction_id: Optional[str] = None,
+        database: Optional[str] = None,
+        batch_size: int = MAX_RECORDS,
+    ) -> UpdateResults:
+        _check_batch_size(batch_size)
+        if self._transaction_id:
+            start_transaction: bool = False
+        else:
+            await self.begin(database=database)
+            start_transaction = True
+        kwargs = self._statement_kwargs(query, transaction_id, database)
+        batch_execute_statement = self._batch_execute_statement
+        results_sets: List[Dict[str, Any]] = []
+        try:
+            for sql_parameter_sets in _slice_parameter_sets(parameter_sets, batch_size):
+                response = await batch_execute_statement(
+                    parameterSets=sql_parameter_sets, **kwargs
+                )
+                results_sets.extend(response['updateResults'])
+        except:
+            if start_transaction:
+                await self.rollback()
+            raise
+        if start_transaction:
+            await self.commit()
+        return UpdateResults(results_sets)
+
+
+class AsyncCursor(BaseCursor):
+    __slots__ = ('_data_api',)
+
+    def __init__(self, data_api: AsyncDataAPI) -> None:
+        super().__init__()
+        self._data_api: AsyncDataAPI = data_api
+
+    async def execute(
+        self, operation: Any, parameters: Optional[Dict[str, Any]] = None
+    ) -> 'AsyncCursor':
+        try:
+            self._set_result(await self._data_api.execute(operation, parameters))
+        except:
+            self.description = None
+            raise
+        return self
+
+    async def executemany(
+        self, operation: Any, seq_of_parameters: Optional[List[Dict[str, Any]]] = None
+    ) -> 'AsyncCursor':
+        self.description = None
+        self._set_update_results(
+            await self._data_api.batch_execute(
+                operation, seq_of_parameters, batch_size=self.batch_size
+            )
+        )
+        return self
+
+
+class AsyncConnection:
+    __slots__ = ('_data_api', '_begin_pending', '_client_context', 'closed')
+
+    paramstyle = paramstyle
+    Error = Error
+
+    def __init__(self, data_api: AsyncDataAPI, client_context: Any = None) -> None:
+        self._data_api: AsyncDataAPI = data_api
+        self._client_context: Any = client_context
+        self._begin_pending: bool = False
+        self.closed = False
+
+    async def close(self) -> None:
+        if self._client_context is not None:
+            await self._client_context.__aexit__(None, None, None)
+            self._client_context = None
+        self.closed = True
+
+    async def commit(self) -> None:
+        if self._data_api.transaction_id:
+            await self._data_api.commit()
+            self._data_api._transaction_id = None
+
+    async def rollback(self) -> None:
+        if self._data_api.transaction_id:
+            await self._data_api.rollback()
+            self._data_api._transaction_id = None
+
+    async def _begin_auto_transaction(self) -> None:
+        if not self._data_api.transaction_id and (
+            self._begin_pending or self._data_api.auto_transaction
+        ):
+            await self._data_api.begin()
+        self._begin_pending = False
+
+    async def cursor(self) -> AsyncCursor:
+        await self._begin_auto_transaction()
+        return AsyncCursor(self._data_api)
+
+    async def execute(self, operation: Any, parameters: Any = None) -> AsyncCursor:
+        await self._begin_auto_transaction()
+        return await AsyncCursor(self._data_api).execute(operation, parameters)
+
+    async def __aenter__(self) -> 'AsyncConnection':
+        # BeginTransaction is deferred until the first cursor is requested, as in
+        # Connection.__enter__.
+        self._begin_pending = True
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self._begin_pending = False
+        rollback_exception = self._data_api.rollback_exception
+        try:
+            if exc_type is None or (
+                rollback_exception is not None
+                and not issubclass(exc_type, rollback_exception)
+            ):
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            # a client created by connect() is owned by the connection
+            if self._client_context is not None:
+                await self.close()
+
+
+async def find_arn_by_resource_name(resource_name: str, rds_client: Any = None) -> str:
+    if rds_client is None:
+        async with get_session().create_client('rds') as rds_client:
+            return await find_arn_by_resource_name(resource_name, rds_client)
+    response = await rds_client.describe_db_clusters(DBClusterIdentifier=resource_name)
+    return response['DBClusters'][0]['DBClusterArn']
+
+
+async def connect(
+    secret_arn: str,
+    resource_arn: Optional[str] = None,
+    resource_name: Optional[str] = None,
+    database: Optional[str] = None,
+    transaction_id: Optional[str] = None,
+    client: Any = None,
+    rollback_exception: Optional[Type[Exception]] = None,
+    rds_client: Any = None,
+    auto_transaction: Optional[bool] = True,
+) -> AsyncConnection:
+    if resource_name:
+        if resource_arn:
+            raise DataAPIError(
+                f'resource_name should be set without resource_arn. resource_arn: {resource_arn},'
+                f' resource_name: {resource_name}'
+            )
+        resource_arn = await find_arn_by_resource_name(resource_name, rds_client)
+    if not resource_arn:
+        raise DataAPIError('Not Found resource_arn.')
+    client_context: Any = None
+    if client is None:
+        client_context = get_session().create_client(
+            'rds-data', region_name=resource_arn.split(':')[3]
+        )
+        client = await client_context.__aenter__()
+    data_api = AsyncDataAPI(
+        secret_arn=secret_arn,
+        resource_arn=resource_arn,
+        client=client,
+        database=database,
+        transaction_id=transaction_id,
+        rollback_exception=rollback_exception,
+        auto_transaction=auto_transaction,
+    )
+    return AsyncConnection(data_api, client_context)
@@ -1,11 +1,14 @@
 import datetime
+import weakref
 from decimal import Decimal
+from functools import lru_cache
+from itertools import starmap
+from operator import attrgetter, itemgetter
 from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 
 import boto3
-from pydantic import BaseModel
 
-from .pydataapi import DataAPI
+from .pydataapi import MAX_RECORDS, DataAPI, Result, UpdateResults
 
 apilevel: str = '2.0'
 threadsafety: int = 2
@@ -68,18 +71,29 @@ JDBC_TYPES: Dict[int, Type[Any]] = {
 }
 
 
+@lru_cache(maxsize=4096)
+def _get_column_description(
+    label: str, type_: int, precision: int, scale: int, nullable: int
+) -> Tuple[Any, ...]:
+    return (
+        label,  # name
+        JDBC_TYPES.get(type_),  # type_code,
+        0,  # display_size,
+        0,  # internal_size,
+        precision,  # precision,
+        scale,  # scale,
+        nullable,
+    )
+
+
+_get_column_meta = itemgetter('label', 'type', 'precision', 'scale', 'nullable')
+
+_get_generated_fields = attrgetter('generated_fields')
+
+
 def get_description(column_metadata: List[Dict[str, Any]]) -> Tuple[Any, ...]:
     return tuple(
-        (
-            meta['label'],  # name
-            JDBC_TYPES.get(meta['type']),  # type_code,
-            0,  # display_size,
-            0,  # internal_size,
-            meta['precision'],  # precision,
-            meta['scale'],  # scale,
-            meta['nullable'],
-        )
-        for meta in column_metadata
+        starmap(_get_column_description, map(_get_column_meta, column_metadata))
     )
 
 
@@ -87,38 +101,37 @@ class Error(Exception):
     pass
 
 
-class ConnectArgs(BaseModel):
-    secret_arn: str
-    resource_arn: Optional[str]
-    resource_name: Optional[str]
-    database: Optional[str] = None
-    transaction_id: Optional[str] = None
-    client: Optional[Any] = None
-    rollback_exception: Optional[Type[Exception]] = None
-    rds_client: Optional[Any] = None
-    auto_transaction: Optional[bool] = True
-
-
 class Connection:
+    __slots__ = (
+        '_data_api',
+        '_begin_pending',
+        '_rollback_exception',
+        'closed',
+        'cursors',
+    )
+
     paramstyle = paramstyle
     Error = Error
 
     def __init__(self, **kwargs: Any) -> None:
-        connect_args = ConnectArgs.parse_obj(kwargs)
         self._data_api = DataAPI(
-            secret_arn=connect_args.secret_arn,
-            resource_arn=connect_args.resource_arn,
-            resource_name=connect_args.resource_name,
-            database=connect_args.database,
-            transaction_id=connect_args.transaction_id,
-            client=connect_args.client,
-            rollback_exception=connect_args.rollback_exception,
-            rds_client=connect_args.rds_client,
-            auto_transaction=connect_args.auto_transaction,
+            secret_arn=kwargs['secret_arn'],
+            resource_arn=kwargs.get('resource_arn'),
+            resource_name=kwargs.get('resource_name'),
+            database=kwargs.get('database'),
+            transaction_id=kwargs.get('transaction_id'),
+            client=kwargs.get('client'),
+            rollback_exception=kwargs.get('rollback_exception'),
+            rds_client=kwargs.get('rds_client'),
+            auto_transaction=kwargs.get('auto_transaction', True),
+        )
+        self._rollback_exception: Optional[Type[Exception]] = kwargs.get(
+            'rollback_exception'
         )
 
+        self._begin_pending: bool = False
         self.closed = False
-        self.cursors: List[Cursor] = []
+        self.cursors: 'weakref.WeakSet[Cursor]' = weakref.WeakSet()
 
     def close(self) -> None:
         self.closed = True
@@ -133,11 +146,17 @@ class Connection:
             self._data_api.rollback()
             self._data_api._transaction_id = None
 
-    def cursor(self) -> 'Cursor':
-        if not self._data_api.transaction_id and self._data_api.auto_transaction:
+    def _begin_auto_transaction(self) -> None:
+        if not self._data_api.transaction_id and (
+            self._begin_pending or self._data_api.auto_transaction
+        ):
             self._data_api.begin()
+        self._begin_pending = False
+
+    def cursor(self) -> 'Cursor':
+        self._begin_auto_transaction()
         cursor = Cursor(self._data_api)
-        self.cursors.append(cursor)
+        self.cursors.add(cursor)
 
         return cursor
 
@@ -146,39 +165,54 @@ class Connection:
         return cls(**kwargs)
 
     def execute(self, operation: Any, parameters: Any = None) -> 'Cursor':
-        return self.cursor().execute(operation, parameters)
+        self._begin_auto_transaction()
+        return Cursor(self._data_api).execute(operation, parameters)
 
     def __enter__(self) -> 'Connection':
-        self._data_api.begin()
+        # BeginTransaction is deferred until the first cursor is requested, so a
+        # block that runs no statements costs no round trips.
+        self._begin_pending = True
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        if exc_type is None:
+        self._begin_pending = False
+        rollback_exception = self._rollback_exception
+        if exc_type is None or (
+            rollback_exception is not None
+            and not issubclass(exc_type, rollback_exception)
+        ):
             self.commit()
         else:
-            if self._data_api.rollback_exception:
-                if issubclass(exc_type, self._data_api.rollback_exception):
-                    self.rollback()
-                else:
-                    self.commit()
-            else:
-                self.rollback()
+            self.rollback()
 
     @staticmethod
     def Binary(x: Any) -> Any:
         return x  # pragma: no cover
 
 
-class Cursor:
-    def __init__(self, data_api: DataAPI) -> None:
-        self._data_api: DataAPI = data_api
+class BaseCursor:
+    __slots__ = (
+        'arraysize',
+        'batch_size',
+        'closed',
+        'description',
+        '_rows',
+        '_position',
+        '_rowcount',
+        '_lastrowid',
+        '__weakref__',
+    )
+
+    def __init__(self) -> None:
         self.arraysize = 1
+        self.batch_size = MAX_RECORDS
 
         self.closed = False
 
-        self.description: Optional[List[Any]] = None
+        self.description: Optional[Tuple[Any, ...]] = None
 
         self._rows: List[List[Any]] = []
+        self._position: int = 0
         self._rowcount: int = -1
         self._lastrowid: Optional[int] = None
 
@@ -193,47 +227,38 @@ class Cursor:
     def close(self) -> None:
         self.closed = True
 
-    def execute(
-        self, operation: Any, parameters: Optional[Dict[str, Any]] = None
-    ) -> 'Cursor':
-        self.description = None
-        result = self._data_api.execute(operation, parameters)
-        self.description = get_description(  # type: ignore
-            getattr(result, '_column_metadata')
-        )
-        rows: List[List[Any]] = getattr(result, '_rows')
-        self._rows = rows
+    def _set_result(self, result: Result) -> None:
+        self.description = get_description(result._column_metadata)
+        rows = self._rows = result._rows
+        self._position = 0
         self._rowcount = len(rows) or result.number_of_records_updated
         self._lastrowid = result.generated_fields_first  # type: ignore
-        return self
 
-    def executemany(
-        self, operation: Any, seq_of_parameters: Optional[List[Dict[str, Any]]] = None
-    ) -> 'Cursor':
-        self.description = None
-        results = self._data_api.batch_execute(operation, seq_of_parameters)
-        self._rows = [result.generated_fields for result in results]
+    def _set_update_results(self, results: UpdateResults) -> None:
+        self._rows = list(map(_get_generated_fields, results))
+        self._position = 0
         self._rowcount = len(self._rows)
-        self.description = []
         self._lastrowid = (
             results[-1].generated_fields_first if results else None  # type: ignore
         )
-        return self
 
     def fetchone(self) -> Optional[List[Any]]:
         try:
-            return self._rows.pop(0)
+            row = self._rows[self._position]
         except IndexError:
             return None
+        self._position += 1
+        return row
 
     def fetchmany(self, size: Optional[int] = None) -> List[List[Any]]:
-        size = size or self.arraysize
-        result, self._rows = self._rows[:size], self._rows[size:]
-        return result
+        start = self._position
+        end = min(start + (size or self.arraysize), len(self._rows))
+        self._position = end
+        return self._rows[start:end]
 
     def fetchall(self) -> List[List[Any]]:
-        rows = self._rows
-        self._rows = []
+        rows = self._rows if self._position == 0 else self._rows[self._position :]
+        self._position = len(self._rows)
         return rows
 
     def setinputsizes(self, sizes: Any) -> None:  # pragma: no cover
@@ -243,7 +268,39 @@ class Cursor:
         pass
 
     def __iter__(self) -> Iterator[List[Any]]:
-        return iter(self._rows)
+        rows = self._rows
+        while self._rows is rows and self._position < len(rows):
+            self._position += 1
+            yield rows[self._position - 1]
+
+
+class Cursor(BaseCursor):
+    __slots__ = ('_data_api',)
+
+    def __init__(self, data_api: DataAPI) -> None:
+        super().__init__()
+        self._data_api: DataAPI = data_api
+
+    def execute(
+        self, operation: Any, parameters: Optional[Dict[str, Any]] = None
+    ) -> 'Cursor':
+        try:
+            self._set_result(self._data_api.execute(operation, parameters))
+        except:
+            self.description = None
+            raise
+        return self
+
+    def executemany(
+        self, operation: Any, seq_of_parameters: Optional[List[Dict[str, Any]]] = None
+    ) -> 'Cursor':
+        self.description = None
+        self._set_update_results(
+            self._data_api.batch_execute(
+                operation, seq_of_parameters, batch_size=self.batch_size
+            )
+        )
+        return self
 
 
 def connect(
@@ -1,7 +1,18 @@
 import datetime
 import re
 from abc import ABC
-from typing import Any, Callable, List, Optional, Pattern, Type, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from botocore.exceptions import ClientError
 from sqlalchemy import cast
@@ -42,33 +53,126 @@ class DataAPIDialect(DefaultDialect, ABC):
 
 DatetimeProtocol = Union[datetime.date, datetime.datetime, datetime.time]
 
-DATE_PATTERN: Pattern[str] = re.compile(r'^\d{4}-[0-1]\d-[0-3]\d$')
+DATE_PATTERN: Pattern[str] = re.compile(r'\d{4}-[0-1]\d-[0-3]\d$')
 
 DATETIME_PATTERN: Pattern[str] = re.compile(
-    r'^\d{4}-[0-1]\d-[0-3]\d [0-2]\d:[0-6]\d:[0-6]\d$'
+    r'\d{4}-[0-1]\d-[0-3]\d [0-2]\d:[0-6]\d:[0-6]\d$'
 )
 DATETIME_MICROSECOND_PATTERN: Pattern[str] = re.compile(
-    r'^\d{4}-[0-1]\d-[0-3]\d [0-2]\d:[0-6]\d:[0-6]\d\.\d{1,6}$'
+    r'\d{4}-[0-1]\d-[0-3]\d [0-2]\d:[0-6]\d:[0-6]\d\.\d{1,6}$'
 )
 
 DATE_FORMAT: str = '%Y-%m-%d'
 DATETIME_FORMAT: str = '%Y-%m-%d %H:%M:%S'
 DATETIME_MICROSECOND_FORMAT: str = '%Y-%m-%d %H:%M:%S.%f'
 
+DATETIME_PATTERN_FORMATS: Tuple[Tuple[Pattern[str], str], ...] = (
+    (DATETIME_MICROSECOND_PATTERN, DATETIME_MICROSECOND_FORMAT),
+    (DATETIME_PATTERN, DATETIME_FORMAT),
+    (DATE_PATTERN, DATE_FORMAT),
+)
+
+_strptime = datetime.datetime.strptime
+
+
+def _parse_datetime_by_pattern(value: str) -> datetime.datetime:
+    for pattern, format_ in DATETIME_PATTERN_FORMATS:
+        if pattern.match(value):
+            return _strptime(value, format_)
+    raise ValueError(f'Invalid isoformat string: {value!r}')
+
+
+_fromisoformat: Callable[[str], datetime.datetime] = getattr(
+    datetime.datetime, 'fromisoformat', _parse_datetime_by_pattern  # Python 3.6
+)
+
+DATE_LENGTH: int = 10
+DATETIME_LENGTH: int = 19
+DATETIME_MICROSECOND_LENGTH: int = 26
+
 
 def _parse_datetime(value: Union[str, float, int]) -> Optional[datetime.datetime]:
     if isinstance(value, str):  # TODO Support timezone
-        if re.search(DATETIME_PATTERN, value):
-            return datetime.datetime.strptime(value, DATETIME_FORMAT)
-        elif re.search(DATETIME_MICROSECOND_PATTERN, value):
-            return datetime.datetime.strptime(value, DATETIME_MICROSECOND_FORMAT)
-        elif re.search(DATE_PATTERN, value):
-            return datetime.datetime.strptime(value, DATE_FORMAT)
+        length = len(value)
+        if length > DATETIME_LENGTH + 1 and length <= DATETIME_MICROSECOND_LENGTH:
+            if (
+                value[DATETIME_LENGTH] != '.'
+                or not value[DATETIME_LENGTH + 1 :].isdigit()
+            ):
+                return None
+            # fromisoformat only accepts 3 or 6 fractional digits before Python 3.11
+            value = value.ljust(DATETIME_MICROSECOND_LENGTH, '0')
+        elif length != DATETIME_LENGTH and length != DATE_LENGTH:
+            return None
+        # fromisoformat accepts more than the baseline patterns on Python 3.11+
+        # (week dates, 'T' separators, UTC offsets), so check the shape first
+        if value[4] != '-' or value[7] != '-':
+            return None
+        if length > DATE_LENGTH and (
+            value[10] != ' ' or value[13] != ':' or value[16] != ':'
+        ):
+            return None
+        try:
+            return _fromisoformat(value)
+        except ValueError:
+            return None
     elif isinstance(value, (int, float)):
         return datetime.datetime.fromtimestamp(value)
     return None  # pragma: no cover
 
 
+def _bind_datetime(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return value.strftime(DATETIME_MICROSECOND_FORMAT)
+    return value
+
+
+def _bind_date(value: Any) -> Any:
+    if isinstance(value, datetime.date):
+        return value.strftime(DATETIME_MICROSECOND_FORMAT)
+    return value
+
+
+def _bind_time(value: Any) -> Any:
+    if isinstance(value, datetime.time):
+        return value.strftime(DATETIME_MICROSECOND_FORMAT)
+    return value
+
+
+def _process_datetime_result(value: Any) -> Any:
+    parsed_datetime = _parse_datetime(value)
+    if parsed_datetime is not None:
+        return parsed_datetime
+    return value  # pragma: no cover
+
+
+def _process_date_result(value: Any) -> Any:
+    parsed_datetime = _parse_datetime(value)
+    if parsed_datetime is not None:
+        return parsed_datetime.date()
+    return value  # pragma: no cover
+
+
+def _process_time_result(value: Any) -> Any:  # pragma: no cover
+    parsed_datetime = _parse_datetime(value)
+    if parsed_datetime is not None:
+        return parsed_datetime.time()
+    return value
+
+
+BIND_PROCESSORS: Dict[Type[DatetimeProtocol], Callable[[Any], Any]] = {
+    datetime.datetime: _bind_datetime,
+    datetime.date: _bind_date,
+    datetime.time: _bind_time,
+}
+
+RESULT_PROCESSORS: Dict[Type[DatetimeProtocol], Callable[[Any], Any]] = {
+    datetime.datetime: _process_datetime_result,
+    datetime.date: _process_date_result,
+    datetime.time: _process_time_result,
+}
+
+
 class DataAPIDatetimeBase:
     python_type: Type[DatetimeProtocol]
     db_type: Type[TypeEngine]
@@ -77,25 +181,10 @@ class DataAPIDatetimeBase:
         return cast(value, self.db_type)
 
     def bind_processor(self, dialect: DataAPIDialect) -> Callable[..., Any]:
-        def process_bind_value(value: Any) -> Any:
-            if isinstance(value, self.python_type):
-                return value.strftime(DATETIME_MICROSECOND_FORMAT)
-            return value
-
-        return process_bind_value
+        return BIND_PROCESSORS[self.python_type]
 
     def result_processor(self, dialect: DataAPIDialect, coltype: List[Any]) -> Any:
-        def process_result_value(value: Any) -> Any:
-            parsed_datetime = _parse_datetime(value)
-            if parsed_datetime:
-                if self.python_type == datetime.time:  # pragma: no cover
-                    return parsed_datetime.time()
-                elif self.python_type == datetime.date:
-                    return parsed_datetime.date()
-                return parsed_datetime
-            return value  # pragma: no cover
-
-        return process_result_value
+        return RESULT_PROCESSORS[self.python_type]
 
 
 class DataAPIDatetime(DataAPIDatetimeBase, sqltypes.DATE):
@@ -108,9 +197,6 @@ class DataAPIDialectMixin:
         try:
             return super().has_table(connection, table_name, schema)  # type: ignore
         except ClientError as e:
-            if re.match(
-                r"(\(conn=\d+\) )?Table '.+' doesn't exist",
-                e.response['Error']['Message'],
-            ):  # pragma: no cover
+            if "doesn't exist" in e.response['Error']['Message']:  # pragma: no cover
                 return False
             raise  # pragma: no cover
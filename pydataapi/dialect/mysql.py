@@ -1,6 +1,5 @@
 from typing import Any, Type
 
-from sqlalchemy import util
 from sqlalchemy.dialects.mysql.base import DATE, DATETIME, TIME, TIMESTAMP, MySQLDialect
 from sqlalchemy.sql.type_api import TypeEngine
 
@@ -48,12 +47,10 @@ class MySQLDataAPIDialect(DataAPIDialectMixin, MySQLDialect, DataAPIDialect):
     name = "mysql"
     default_paramstyle = "named"
 
-    colspecs = util.update_copy(
-        MySQLDialect.colspecs,
-        {
-            TIMESTAMP: DataAPITimestamp,
-            DATE: DataAPIDate,
-            TIME: DataAPITime,
-            DATETIME: DataAPIDateTime,
-        },
-    )
+    colspecs = {
+        **MySQLDialect.colspecs,
+        TIMESTAMP: DataAPITimestamp,
+        DATE: DataAPIDate,
+        TIME: DataAPITime,
+        DATETIME: DataAPIDateTime,
+    }
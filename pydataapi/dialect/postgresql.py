@@ -1,6 +1,5 @@
 from typing import Type
 
-from sqlalchemy import util
 from sqlalchemy.dialects.postgresql.base import DATE, TIME, TIMESTAMP, PGDialect
 from sqlalchemy.sql.type_api import TypeEngine
 
@@ -41,7 +40,9 @@ class PostgreSQLDataAPIDialect(DataAPIDialectMixin, PGDialect, DataAPIDialect):
     supports_sane_rowcount = True
     isolation_level = None
 
-    colspecs = util.update_copy(
-        PGDialect.colspecs,
-        {TIMESTAMP: DataAPITimestamp, DATE: DataAPIDate, TIME: DataAPITime},
-    )
+    colspecs = {
+        **PGDialect.colspecs,
+        TIMESTAMP: DataAPITimestamp,
+        DATE: DataAPIDate,
+        TIME: DataAPITime,
+    }
@@ -2,12 +2,19 @@ class DataAPIError(Exception):
     def __init__(self, message: str) -> None:
         self.message = message
 
+    def __str__(self) -> str:
+        return self.message
+
 
 class MultipleResultsFound(DataAPIError):
+    message = 'Multiple rows were found for one()'
+
     def __init__(self) -> None:
-        super().__init__('Multiple rows were found for one()')
+        pass
 
 
 class NoResultFound(DataAPIError):
+    message = 'No row was found for one()'
+
     def __init__(self) -> None:
-        super().__init__('No row was found for one()')
+        pass
@@ -1,6 +1,7 @@
 from datetime import date, datetime, time
 from decimal import Decimal
-from functools import wraps
+from functools import lru_cache, wraps
+from operator import itemgetter
 from typing import (
     Any,
     Callable,
@@ -16,8 +17,6 @@ from typing import (
 )
 
 import boto3
-from more_itertools import chunked, flatten
-from pydantic import BaseModel, Field, root_validator, validator
 from sqlalchemy import Column
 from sqlalchemy.dialects import mysql
 from sqlalchemy.engine import Dialect, default
@@ -29,7 +28,7 @@ MAX_RECORDS: int = 1000
 DIALECT: Dialect = mysql.dialect(paramstyle="named")
 
 QUERY_STATEMENT_COMPILE_PARAMS = {
-    "dialect": mysql.dialect(paramstyle="named"),
+    "dialect": DIALECT,
     "compile_kwargs": {"literal_binds": True},
 }
 
@@ -47,40 +46,54 @@ LONG_VALUES: str = "longValues"
 DOUBLE_VALUES: str = "doubleValues"
 BLOB_VALUES: str = "blobValues"
 
+# Shared by every NULL parameter; boto3 only reads it when serializing.
+NULL_VALUE: Dict[str, bool] = {IS_NULL: True}
+
 DECIMAL_TYPE_HINT: str = "DECIMAL"
 TIMESTAMP_TYPE_HINT: str = "TIMESTAMP"
 TIME_TYPE_HINT: str = "TIME"
 DATE_TYPE_HINT: str = "DATE"
 
 
+ARRAY_VALUES_KEYS: Dict[type, str] = {
+    str: STRING_VALUES,
+    int: LONG_VALUES,
+    float: DOUBLE_VALUES,
+    bool: BOOLEAN_VALUES,
+    bytes: BLOB_VALUES,
+}
+
+
 def convert_array_value(value: Union[List[Any], Tuple[Any, ...]]) -> Dict[str, Any]:
     first_value: Any = value[0]
-    if isinstance(first_value, (list, tuple)):
-        return {
-            ARRAY_VALUE: {
-                ARRAY_VALUES: [
-                    convert_array_value(nested_value) for nested_value in value
-                ]
+    values_key: Optional[str] = ARRAY_VALUES_KEYS.get(type(first_value))
+    if values_key is None:
+        if isinstance(first_value, (list, tuple)):
+            return {
+                ARRAY_VALUE: {
+                    ARRAY_VALUES: [
+                        convert_array_value(nested_value) for nested_value in value
+                    ]
+                }
             }
-        }
-
-    values_key: Optional[str] = None
-    if isinstance(first_value, bool):
-        values_key = BOOLEAN_VALUES
-    elif isinstance(first_value, str):
-        values_key = STRING_VALUES
-    elif isinstance(first_value, int):
-        values_key = LONG_VALUES
-    elif isinstance(first_value, float):
-        values_key = DOUBLE_VALUES
-    elif isinstance(first_value, bytes):
-        values_key = BLOB_VALUES
-    if values_key:
-        return {ARRAY_VALUE: {values_key: list(value)}}
-    raise Exception(f"unsupported array type {type(value[0])}]: {value} ")
+        if isinstance(first_value, bool):
+            values_key = BOOLEAN_VALUES
+        elif isinstance(first_value, str):
+            values_key = STRING_VALUES
+        elif isinstance(first_value, int):
+            values_key = LONG_VALUES
+        elif isinstance(first_value, float):
+            values_key = DOUBLE_VALUES
+        elif isinstance(first_value, bytes):
+            values_key = BLOB_VALUES
+        else:
+            raise Exception(f"unsupported array type {type(value[0])}]: {value} ")
+    return {
+        ARRAY_VALUE: {values_key: value if isinstance(value, list) else list(value)}
+    }
 
 
-def create_sql_parameter(key: str, value: Any) -> Dict[str, Any]:
+def _create_sql_parameter(key: str, value: Any) -> Dict[str, Any]:
     converted_value: Dict[str, Any]
     type_hint: Optional[str] = None
 
@@ -95,12 +108,12 @@ def create_sql_parameter(key: str, value: Any) -> Dict[str, Any]:
     elif isinstance(value, bytes):
         converted_value = {BLOB_VALUE: value}
     elif value is None:
-        converted_value = {IS_NULL: True}
+        converted_value = NULL_VALUE
     elif isinstance(value, (list, tuple)):
         if value:
             converted_value = convert_array_value(value)
         else:
-            converted_value = {IS_NULL: True}
+            converted_value = NULL_VALUE
     elif isinstance(value, Decimal):
         converted_value = {STRING_VALUE: str(value)}
         type_hint = DECIMAL_TYPE_HINT
@@ -121,78 +134,157 @@ def create_sql_parameter(key: str, value: Any) -> Dict[str, Any]:
     return {"name": key, "value": converted_value}
 
 
+def _create_array_parameter(
+    key: str, value: Union[List[Any], Tuple[Any, ...]]
+) -> Dict[str, Any]:
+    if value:
+        return {"name": key, "value": convert_array_value(value)}
+    return {"name": key, "value": NULL_VALUE}
+
+
+SQL_PARAMETER_CONVERTERS: Dict[type, Callable[[str, Any], Dict[str, Any]]] = {
+    str: lambda key, value: {"name": key, "value": {STRING_VALUE: value}},
+    int: lambda key, value: {"name": key, "value": {LONG_VALUE: value}},
+    type(None): lambda key, value: {"name": key, "value": NULL_VALUE},
+    float: lambda key, value: {"name": key, "value": {DOUBLE_VALUE: value}},
+    bool: lambda key, value: {"name": key, "value": {BOOLEAN_VALUE: value}},
+    bytes: lambda key, value: {"name": key, "value": {BLOB_VALUE: value}},
+    list: _create_array_parameter,
+    tuple: _create_array_parameter,
+}
+
+
+def create_sql_parameter(key: str, value: Any) -> Dict[str, Any]:
+    converter = SQL_PARAMETER_CONVERTERS.get(type(value))
+    if converter is None:
+        return _create_sql_parameter(key, value)
+    return converter(key, value)
+
+
 def create_sql_parameters(
     parameter: Dict[str, Any]
 ) -> List[Dict[str, Union[str, Dict[str, Any]]]]:
-    return [create_sql_parameter(key, value) for key, value in parameter.items()]
+    get_converter = SQL_PARAMETER_CONVERTERS.get
+    return [
+        {"name": key, "value": {STRING_VALUE: value}}
+        if type(value) is str
+        else (get_converter(type(value)) or _create_sql_parameter)(key, value)
+        for key, value in parameter.items()
+    ]
+
+
+def create_sql_parameter_sets(
+    parameter_sets: Sequence[Dict[str, Any]]
+) -> List[List[Dict[str, Any]]]:
+    return [create_sql_parameters(parameter) for parameter in parameter_sets]
+
+
+_MISSING: Any = object()
 
 
 def _get_value_from_row(row: Dict[str, Any]) -> Any:
-    key = tuple(row.keys())[0]
-    if key == IS_NULL:
+    value = row.get(STRING_VALUE, _MISSING)
+    if value is not _MISSING:
+        return value
+    value = row.get(LONG_VALUE, _MISSING)
+    if value is not _MISSING:
+        return value
+    if IS_NULL in row:
         return None
+    key = next(iter(row))
     value = row[key]
     if key == ARRAY_VALUE:
-        array_key: str = tuple(value.keys())[0]
+        array_key: str = next(iter(value))
         array_value: Union[
             List[Dict[str, Dict[str, Any]]], Dict[str, List[Any]]
         ] = value[array_key]
         if array_key == ARRAY_VALUES:
             return [
-                tuple(nested_value[ARRAY_VALUE].values())[0]  # type: ignore
+                next(iter(nested_value[ARRAY_VALUE].values()))  # type: ignore
                 for nested_value in array_value
             ]
         return array_value
     return value
 
 
+def _get_column_key(column: Dict[str, Any]) -> str:
+    key = next(iter(column))
+    if key == IS_NULL or key == ARRAY_VALUE:
+        return ""  # never a field key, so the column takes the generic path
+    return key
+
+
+def _get_column_getter(key: str) -> Callable[[Dict[str, Any]], Any]:
+    if key:
+        return itemgetter(key)
+    return _get_value_from_row
+
+
+def _get_values_from_records(records: List[List[Dict[str, Any]]]) -> List[List[Any]]:
+    if not records:
+        return []
+    keys = [_get_column_key(column) for column in records[0]]
+    getters = [_get_column_getter(key) for key in keys]
+    values: List[List[Any]] = []
+    append = values.append
+    for row in records:
+        try:
+            append([getter(column) for getter, column in zip(getters, row)])
+        except KeyError:
+            # A cell's key differs from the first record's (usually a NULL);
+            # decode that column generically from here on.
+            keys = [key if key in column else "" for key, column in zip(keys, row)]
+            getters = [_get_column_getter(key) for key in keys]
+            append([getter(column) for getter, column in zip(getters, row)])
+    return values
+
+
 T = TypeVar("T")
 
+_get_label = itemgetter("label")
+
 
 class GeneratedFields:
+    __slots__ = ("_generated_fields",)
+
     def __repr__(self) -> str:
-        values: str = ", ".join(str(f) for f in self.generated_fields)
+        values: str = ", ".join(str(f) for f in self._generated_fields)
         return f"<{self.__class__.__name__}({values})>"
 
     def __init__(self, generated_fields: List[Dict[str, Any]]):
-        self._generated_fields_raw: List[Dict[str, Any]] = generated_fields
-        self._generated_fields: Optional[List[str]] = None
+        self._generated_fields: List[Any] = [
+            _get_value_from_row(f) for f in generated_fields
+        ]
 
     @property
     def generated_fields(self) -> List[Any]:
-        if self._generated_fields is None:
-            self._generated_fields = [
-                _get_value_from_row(f) for f in self._generated_fields_raw
-            ]
         return self._generated_fields
 
     @property
     def generated_fields_first(self) -> Union[str, int, float, None]:
-        if self.generated_fields:
-            return self.generated_fields[0]
+        if self._generated_fields:
+            return self._generated_fields[0]
         return None
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, GeneratedFields):
-            return self.generated_fields == other.generated_fields
+            return self._generated_fields == other._generated_fields
         elif isinstance(other, list):
-            return self.generated_fields == other
+            return self._generated_fields == other
         elif isinstance(other, tuple):
-            return self.generated_fields == list(other)
+            return self._generated_fields == list(other)
         return False
 
 
-class Record(Sequence[Any], Iterator[Any]):
+class Record(Sequence[Any]):
+    __slots__ = ("_record", "_headers")
+
     def __repr__(self) -> str:
         values: str = ", ".join(f"{k}={str(v)}" for k, v in self.dict().items())
         return f"<{self.__class__.__name__}({values})>"
 
-    def __next__(self) -> Any:
-        self._index += 1
-        try:
-            return self[self._index]
-        except IndexError:
-            raise StopIteration
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._record)
 
     def __getitem__(self, i: Union[int, slice]) -> Any:
         return self._record[i]
@@ -203,14 +295,20 @@ class Record(Sequence[Any], Iterator[Any]):
     def __init__(self, row: List[Any], headers: List[str]) -> None:
         self._record: List[Any] = row
         self._headers: List[str] = headers
-        self._index: int = -1
+
+    @classmethod
+    def _make(cls, row: List[Any], headers: List[str]) -> "Record":
+        record = object.__new__(cls)
+        record._record = row
+        record._headers = headers
+        return record
 
     @property
     def headers(self) -> List[str]:
         return self._headers
 
     def dict(self) -> Dict[str, Any]:
-        return {header: column for header, column in zip(self.headers, self._record)}
+        return dict(zip(self._headers, self._record))
 
     def model(self, model_type: Type[T]) -> T:
         return model_type(**self.dict())  # type: ignore
@@ -225,48 +323,57 @@ class Record(Sequence[Any], Iterator[Any]):
         return False
 
 
-class Result(
-    Sequence[Union["Record", List["Record"]]],
-    Iterator[Union["Record", List["Record"]]],
-    GeneratedFields,
-):
-    def __next__(self) -> "Record":
-        self._index += 1
-        try:
-            return self[self._index]  # type: ignore
-        except IndexError:
-            raise StopIteration
+class Result(Sequence[Union["Record", List["Record"]]], GeneratedFields):
+    __slots__ = (
+        "_response",
+        "_records",
+        "_decoded_rows",
+        "_column_metadata",
+        "_headers",
+    )
+
+    def __iter__(self) -> Iterator["Record"]:
+        headers = self._headers
+        for row in self._rows:
+            yield Record._make(row, headers)
 
     def __getitem__(self, i: Union[int, slice]) -> Union["Record", List["Record"]]:
         if isinstance(i, slice):
-            return [Record(r, self.headers) for r in self._rows[i]]
-        return Record(self._rows[i], self.headers)
+            headers = self._headers
+            return [Record._make(r, headers) for r in self._rows[i]]
+        if self._decoded_rows is None:
+            return Record._make(
+                [_get_value_from_row(column) for column in self._records[i]],
+                self._headers,
+            )
+        return Record._make(self._decoded_rows[i], self._headers)
 
     def __len__(self) -> int:
-        return len(self._rows)
+        return len(self._records)
 
     def __init__(
         self,
         response: Dict[Any, Any],
     ) -> None:
         self._response = response
-        self._rows = [
-            [_get_value_from_row(column) for column in row]
-            for row in response.get("records", [])
-        ]
+        self._records: List[List[Dict[str, Any]]] = response.get("records", [])
+        self._decoded_rows: Optional[List[List[Any]]] = None
         self._column_metadata: List[Dict[str, Any]] = response.get("columnMetadata", [])
-        self._headers: Optional[List[str]] = None
-        self._index: int = -1
+        self._headers: List[str] = list(map(_get_label, self._column_metadata))
         super().__init__(response.get("generatedFields", []))
 
+    @property
+    def _rows(self) -> List[List[Any]]:
+        if self._decoded_rows is None:
+            self._decoded_rows = _get_values_from_records(self._records)
+        return self._decoded_rows
+
     @property
     def number_of_records_updated(self) -> int:
         return self._response.get("numberOfRecordsUpdated", 0)
 
     @property
     def headers(self) -> List[str]:
-        if self._headers is None:
-            self._headers = [meta["label"] for meta in self._column_metadata]
         return self._headers
 
     def first(self) -> Optional[Record]:
@@ -292,10 +399,23 @@ class Result(
         return self.one()[0]
 
     def all(self) -> List[Record]:
-        return list(self)  # type: ignore
+        headers = self._headers
+        return [Record._make(row, headers) for row in self._rows]
+
+    def columns(self) -> Dict[str, List[Any]]:
+        rows = self._rows
+        if not rows:
+            return {header: [] for header in self._headers}
+        return dict(zip(self._headers, map(list, zip(*rows))))
 
 
 class UpdateResults(Sequence[GeneratedFields]):
+    __slots__ = ("_update_results",)
+
+    def __iter__(self) -> Iterator[GeneratedFields]:
+        for update_result in self._update_results:
+            yield GeneratedFields(update_result["generatedFields"])
+
     def __getitem__(  # type: ignore
         self, i: Union[int, slice]
     ) -> Union["GeneratedFields", List["GeneratedFields"]]:
@@ -312,104 +432,90 @@ class UpdateResults(Sequence[GeneratedFields]):
         self._update_results = update_results
 
 
-class Options(BaseModel):
-    resourceArn: str
-    secretArn: str
-    sql: Optional[str]
-    database: Optional[str]
-    schema_: Optional[str] = Field(None, alias="schema")
-    transactionId: Optional[str]
-    continueAfterTimeout: Optional[bool]
-    parameters: Optional[List[Dict[str, Any]]]
-    parameterSets: Optional[List[List[Dict[str, Any]]]]
-
-    @root_validator
-    def validate_all(cls, values: Dict[str, Any]) -> Dict[str, Any]:
-        return {k: v for k, v in values.items() if v is not None}
-
-    @validator("parameters", pre=True)
-    def convert_parameters(cls, v: Any) -> Any:
-        if isinstance(v, Dict):
-            return create_sql_parameters(v)
-        return v
-
-    @validator("parameterSets", pre=True)
-    def convert_parameter_sets(cls, v: Any) -> Any:
-        if isinstance(v, (list, tuple)):  # pragma: no cover
-            return [create_sql_parameters(parameter) for parameter in v]
-        return v  # pragma: no cover
-
-    def build(self) -> Dict[str, Any]:
-        return self.dict(exclude_unset=True, by_alias=True)
-
-
 def find_arn_by_resource_name(
     resource_name: str, boto3_client: Optional[boto3.session.Session.client]
 ) -> str:
     if not boto3_client:
-        boto3_client = boto3.client("rds")
+        return _find_arn_by_resource_name(resource_name)
     return boto3_client.describe_db_clusters(DBClusterIdentifier=resource_name)[
         "DBClusters"
     ][0]["DBClusterArn"]
 
 
-class DataAPI:
+@lru_cache(maxsize=64)
+def _find_arn_by_resource_name(resource_name: str) -> str:
+    return find_arn_by_resource_name(resource_name, get_rds_client())
+
+
+@lru_cache(maxsize=1)
+def get_rds_client() -> boto3.session.Session.client:
+    return boto3.client("rds")
+
+
+@lru_cache(maxsize=16)
+def get_rds_data_client(region_name: str) -> boto3.session.Session.client:
+    return boto3.client("rds-data", region_name=region_name)
+
+
+def _check_batch_size(batch_size: int) -> None:
+    if batch_size < 1:
+        raise DataAPIError(f"batch_size must be greater than 0: {batch_size}")
+
+
+def _slice_parameter_sets(
+    parameter_sets: Optional[List[Dict[str, Any]]], batch_size: int
+) -> Iterator[List[List[Dict[str, Any]]]]:
+    if not isinstance(parameter_sets, (list, tuple)):
+        parameter_sets = list(parameter_sets or [])
+    for start in range(0, len(parameter_sets), batch_size):
+        yield create_sql_parameter_sets(parameter_sets[start : start + batch_size])
+
+
+class BaseDataAPI:
+    __slots__ = (
+        "resource_arn",
+        "secret_arn",
+        "database",
+        "_transaction_id",
+        "_client",
+        "_begin_transaction",
+        "_commit_transaction",
+        "_rollback_transaction",
+        "_execute_statement",
+        "_batch_execute_statement",
+        "_transaction_status",
+        "rollback_exception",
+        "_auto_transaction",
+    )
+
     def __init__(
         self,
         *,
         secret_arn: str,
-        resource_arn: Optional[str] = None,
-        resource_name: Optional[str] = None,
+        resource_arn: str,
+        client: Any,
         database: Optional[str] = None,
         transaction_id: Optional[str] = None,
-        client: Optional[boto3.session.Session.client] = None,
         rollback_exception: Optional[Type[Exception]] = None,
-        rds_client: Optional[boto3.session.Session.client] = None,
         auto_transaction: Optional[bool] = None,
     ) -> None:
-        if resource_name:
-            if resource_arn:
-                raise DataAPIError(
-                    f"resource_name should be set without resource_arn. resource_arn: {resource_arn},"
-                    f" resource_name: {resource_name}"
-                )
-            resource_arn = find_arn_by_resource_name(resource_name, rds_client)
-        if not resource_arn:
-            raise DataAPIError("Not Found resource_arn.")
         self.resource_arn: str = resource_arn
         self.secret_arn: str = secret_arn
         self.database: Optional[str] = database
 
-        client_kwargs = {}
-        region_name = resource_arn.split(":")[3]
-        client_kwargs["region_name"] = region_name
-
         self._transaction_id: Optional[str] = transaction_id
-        self._client: boto3.session.Session.client = client or boto3.client(
-            "rds-data", **client_kwargs
-        )
+        self._client: Any = client
+        self._begin_transaction = client.begin_transaction
+        self._commit_transaction = client.commit_transaction
+        self._rollback_transaction = client.rollback_transaction
+        self._execute_statement = client.execute_statement
+        self._batch_execute_statement = client.batch_execute_statement
         self._transaction_status: Optional[str] = None
         self.rollback_exception: Optional[Type[Exception]] = rollback_exception
         self._auto_transaction: Optional[bool] = auto_transaction
 
-    def __enter__(self) -> "DataAPI":
-        self.begin()
-        return self
-
-    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        if exc_type is None:
-            self.commit()
-        else:
-            if self.rollback_exception:
-                if issubclass(exc_type, self.rollback_exception):
-                    self.rollback()
-                else:
-                    self.commit()
-            else:
-                self.rollback()
-
     @property
-    def client(self) -> boto3.session.Session.client:
+    def client(self) -> Any:
         return self._client
 
     @property
@@ -424,44 +530,136 @@ class DataAPI:
     def auto_transaction(self) -> Optional[bool]:
         return self._auto_transaction
 
+    def _begin_kwargs(
+        self, database: Optional[str], schema: Optional[str]
+    ) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {
+            "resourceArn": self.resource_arn,
+            "secretArn": self.secret_arn,
+        }
+        database = database or self.database
+        if database is not None:
+            kwargs["database"] = database
+        if schema is not None:
+            kwargs["schema"] = schema
+        return kwargs
+
+    def _end_transaction_kwargs(self, transaction_id: Optional[str]) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {
+            "resourceArn": self.resource_arn,
+            "secretArn": self.secret_arn,
+        }
+        transaction_id = transaction_id or self._transaction_id
+        if transaction_id is not None:
+            kwargs["transactionId"] = transaction_id
+        return kwargs
+
+    def _execute_kwargs(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]],
+        transaction_id: Optional[str],
+        continue_after_timeout: bool,
+        database: Optional[str],
+    ) -> Dict[str, Any]:
+        kwargs = self._statement_kwargs(query, transaction_id, database)
+        kwargs["includeResultMetadata"] = True
+        if continue_after_timeout is not None:
+            kwargs["continueAfterTimeout"] = continue_after_timeout
+        if isinstance(parameters, dict):
+            kwargs["parameters"] = create_sql_parameters(parameters)
+        elif parameters is not None:
+            kwargs["parameters"] = parameters
+        return kwargs
+
+    def _statement_kwargs(
+        self, query: str, transaction_id: Optional[str], database: Optional[str]
+    ) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {
+            "resourceArn": self.resource_arn,
+            "secretArn": self.secret_arn,
+            "sql": query,
+        }
+        database = database or self.database
+        if database is not None:
+            kwargs["database"] = database
+        transaction_id = transaction_id or self._transaction_id
+        if transaction_id is not None:
+            kwargs["transactionId"] = transaction_id
+        return kwargs
+
+
+class DataAPI(BaseDataAPI):
+    __slots__ = ()
+
+    def __init__(
+        self,
+        *,
+        secret_arn: str,
+        resource_arn: Optional[str] = None,
+        resource_name: Optional[str] = None,
+        database: Optional[str] = None,
+        transaction_id: Optional[str] = None,
+        client: Optional[boto3.session.Session.client] = None,
+        rollback_exception: Optional[Type[Exception]] = None,
+        rds_client: Optional[boto3.session.Session.client] = None,
+        auto_transaction: Optional[bool] = None,
+    ) -> None:
+        if resource_name:
+            if resource_arn:
+                raise DataAPIError(
+                    f"resource_name should be set without resource_arn. resource_arn: {resource_arn},"
+                    f" resource_name: {resource_name}"
+                )
+            resource_arn = find_arn_by_resource_name(resource_name, rds_client)
+        if not resource_arn:
+            raise DataAPIError("Not Found resource_arn.")
+        super().__init__(
+            secret_arn=secret_arn,
+            resource_arn=resource_arn,
+            client=client or get_rds_data_client(resource_arn.split(":")[3]),
+            database=database,
+            transaction_id=transaction_id,
+            rollback_exception=rollback_exception,
+            auto_transaction=auto_transaction,
+        )
+
+    def __enter__(self) -> "DataAPI":
+        self.begin()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        rollback_exception = self.rollback_exception
+        if exc_type is None or (
+            rollback_exception is not None
+            and not issubclass(exc_type, rollback_exception)
+        ):
+            self.commit()
+        else:
+            self.rollback()
+
     def begin(
         self, database: Optional[str] = None, schema: Optional[str] = None
     ) -> str:
-
-        options = Options(
-            resourceArn=self.resource_arn,
-            secretArn=self.secret_arn,
-            database=database or self.database,
-            schema=schema,
+        response: Dict[str, str] = self._begin_transaction(
+            **self._begin_kwargs(database, schema)
         )
-
-        response: Dict[str, str] = self.client.begin_transaction(**options.build())
         self._transaction_id = response["transactionId"]
 
         return response["transactionId"]
 
     def commit(self, transaction_id: Optional[str] = None) -> str:
-
-        options = Options(
-            resourceArn=self.resource_arn,
-            secretArn=self.secret_arn,
-            transactionId=transaction_id or self.transaction_id,
+        response: Dict[str, str] = self._commit_transaction(
+            **self._end_transaction_kwargs(transaction_id)
         )
-
-        response: Dict[str, str] = self.client.commit_transaction(**options.build())
         self._transaction_status = response["transactionStatus"]
 
         return self._transaction_status
 
     def rollback(self, transaction_id: Optional[str] = None) -> str:
-
-        options = Options(
-            resourceArn=self.resource_arn,
-            secretArn=self.secret_arn,
-            transactionId=transaction_id or self.transaction_id,
+        response: Dict[str, str] = self._rollback_transaction(
+            **self._end_transaction_kwargs(transaction_id)
         )
-
-        response: Dict[str, str] = self.client.rollback_transaction(**options.build())
         self._transaction_status = response["transactionStatus"]
 
         return self._transaction_status
@@ -474,54 +672,38 @@ class DataAPI:
         continue_after_timeout: bool = True,
         database: Optional[str] = None,
     ) -> Result:
-
-        options = Options(
-            resourceArn=self.resource_arn,
-            secretArn=self.secret_arn,
-            database=database or self.database,
-            transactionId=transaction_id or self.transaction_id,
-            continueAfterTimeout=continue_after_timeout,
-            parameters=parameters,  # type: ignore
-            sql=query,
-        )
-
-        response = self.client.execute_statement(
-            includeResultMetadata=True, **options.build()
+        return Result(
+            self._execute_statement(
+                **self._execute_kwargs(
+                    query, parameters, transaction_id, continue_after_timeout, database
+                )
+            )
         )
 
-        return Result(response)
-
     def batch_execute(
         self,
         query: str,
         parameter_sets: Optional[List[Dict[str, Any]]],
         transaction_id: Optional[str] = None,
         database: Optional[str] = None,
+        batch_size: int = MAX_RECORDS,
     ) -> UpdateResults:
-
-        if self.transaction_id:
+        _check_batch_size(batch_size)
+        if self._transaction_id:
             start_transaction: bool = False
         else:
             self.begin(database=database)
             start_transaction = True
+        kwargs = self._statement_kwargs(query, transaction_id, database)
+        batch_execute_statement = self._batch_execute_statement
+        results_sets: List[Dict[str, Any]] = []
         try:
-            results_sets = list(
-                flatten(
-                    self.client.batch_execute_statement(
-                        **Options(
-                            resourceArn=self.resource_arn,
-                            secretArn=self.secret_arn,
-                            database=database or self.database,
-                            transactionId=transaction_id or self.transaction_id,
-                            parameterSets=chunked_parameter_sets,  # type: ignore
-                            sql=query,
-                        ).build()
-                    )["updateResults"]
-                    for chunked_parameter_sets in chunked(
-                        parameter_sets or [], MAX_RECORDS
-                    )
+            for sql_parameter_sets in _slice_parameter_sets(parameter_sets, batch_size):
+                results_sets.extend(
+                    batch_execute_statement(parameterSets=sql_parameter_sets, **kwargs)[
+                        "updateResults"
+                    ]
                 )
-            )
         except:
             if start_transaction:
                 self.rollback()
@@ -0,0 +1,277 @@
+import asyncio
+
+import pytest
+
+from pydataapi.exceptions import DataAPIError
+
+pytest.importorskip('aiobotocore')
+
+from pydataapi.aio import AsyncConnection, connect  # noqa: E402
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+@pytest.fixture
+def mocked_client(mocker):
+    client = mocker.Mock()
+
+    def async_method(return_value):
+        async def call(*args, **kwargs):
+            return return_value
+
+        return mocker.Mock(side_effect=call)
+
+    client.begin_transaction = async_method({'transactionId': 'abc'})
+    client.commit_transaction = async_method({'transactionStatus': 'committed'})
+    client.rollback_transaction = async_method({'transactionStatus': 'rolled'})
+    client.async_method = async_method
+    return client
+
+
+def test_connect_without_resource_arn() -> None:
+    with pytest.raises(DataAPIError, match='Not Found resource_arn.'):
+        run(connect(secret_arn='dummy'))
+
+
+def test_execute_select(mocked_client, mocker) -> None:
+    mocked_client.execute_statement = mocked_client.async_method(
+        {
+            'numberOfRecordsUpdated': 0,
+            'records': [
+                [{'longValue': 1}, {'stringValue': 'cat'}],
+                [{'longValue': 2}, {'stringValue': 'dog'}],
+            ],
+        }
+    )
+
+    async def execute():
+        connection = await connect(
+            resource_arn='arn:aws:rds:dummy',
+            secret_arn='dummy',
+            database='test',
+            client=mocked_client,
+        )
+        assert isinstance(connection, AsyncConnection)
+        cursor = await connection.execute('select * from pets')
+        await connection.commit()
+        await connection.close()
+        return cursor
+
+    cursor = run(execute())
+    assert cursor.rowcount == 2
+    assert cursor.fetchone() == [1, 'cat']
+    assert cursor.fetchall() == [[2, 'dog']]
+    assert mocked_client.execute_statement.call_args == mocker.call(
+        continueAfterTimeout=True,
+        database='test',
+        includeResultMetadata=True,
+        resourceArn='arn:aws:rds:dummy',
+        secretArn='dummy',
+        sql='select * from pets',
+        transactionId='abc',
+    )
+    mocked_client.commit_transaction.assert_called_once_with(
+        resourceArn='arn:aws:rds:dummy', secretArn='dummy', transactionId='abc'
+    )
+
+
+def test_executemany(mocked_client, mocker) -> None:
+    mocked_client.batch_execute_statement = mocked_client.async_method(
+        {'updateResults': [{'generatedFields': [{'longValue': 3}]}]}
+    )
+
+    async def executemany():
+        connection = await connect(
+            resource_arn='arn:aws:rds:dummy',
+            secret_arn='dummy',
+            client=mocked_client,
+            auto_transaction=False,
+        )
+        cursor = await connection.cursor()
+        return await cursor.executemany('insert into pets values (:id)', [{'id': 3}])
+
+    cursor = run(executemany())
+    assert cursor.fetchall() == [[3]]
+    assert cursor.lastrowid == 3
+    assert mocked_client.batch_execute_statement.call_args == mocker.call(
+        resourceArn='arn:aws:rds:dummy',
+        secretArn='dummy',
+        sql='insert into pets values (:id)',
+        parameterSets=[[{'name': 'id', 'value': {'longValue': 3}}]],
+        transactionId='abc',
+    )
+    mocked_client.begin_transaction.assert_called_once()
+    mocked_client.commit_transaction.assert_called_once()
+
+
+def test_executemany_invalid_batch_size(mocked_client) -> None:
+    async def executemany():
+        connection = await connect(
+            resource_arn='arn:aws:rds:dummy',
+            secret_arn='dummy',
+            client=mocked_client,
+            auto_transaction=False,
+        )
+        cursor = await connection.cursor()
+        cursor.batch_size = 0
+        return await cursor.executemany('insert into pets values (:id)', [{'id': 3}])
+
+    with pytest.raises(DataAPIError, match='batch_size must be greater than 0'):
+        run(executemany())
+    mocked_client.begin_transaction.assert_not_called()
+
+
+def test_with_statement_exception(mocked_client) -> None:
+    async def execute():
+        connection = await connect(
+            resource_arn='arn:aws:rds:dummy', secret_arn='dummy', client=mocked_client
+        )
+        async with connection:
+            await connection.cursor()
+            raise Exception('error')
+
+    with pytest.raises(Exception, match='error'):
+        run(execute())
+    mocked_client.rollback_transaction.assert_called_once_with(
+        resourceArn='arn:aws:rds:dummy', secretArn='dummy', transactionId='abc'
+    )
+
+
+def test_with_statement_without_statements(mocked_client) -> None:
+    async def execute():
+        connection = await connect(
+            resource_arn='arn:aws:rds:dummy',
+            secret_arn='dummy',
+            client=mocked_client,
+            auto_transaction=False,
+        )
+        async with connection:
+            pass
+
+    run(execute())
+    mocked_client.begin_transaction.assert_not_called()
+    mocked_client.commit_transaction.assert_not_called()
+
+
+def test_with_statement_execute(mocked_client) -> None:
+    mocked_client.execute_statement = mocked_client.async_method(
+        {'numberOfRecordsUpdated': 1}
+    )
+
+    async def execute():
+        connection = await connect(
+            resource_arn='arn:aws:rds:dummy',
+            secret_arn='dummy',
+            client=mocked_client,
+            auto_transaction=False,
+        )
+        async with connection:
+            await connection.execute("insert into pets values (1, 'cat')")
+
+    run(execute())
+    mocked_client.begin_transaction.assert_called_once()
+    mocked_client.commit_transaction.assert_called_once_with(
+        resourceArn='arn:aws:rds:dummy', secretArn='dummy', transactionId='abc'
+    )
+
+
+class ClientContext:
+    def __init__(self, client):
+        self.client = client
+        self.exited = False
+
+    async def __aenter__(self):
+        return self.client
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.exited = True
+
+
+def test_with_statement_closes_own_client(mocked_client, mocker) -> None:
+    client_context = ClientContext(mocked_client)
+    get_session = mocker.patch('pydataapi.aio.get_session')
+    get_session.return_value.create_client.return_value = client_context
+
+    async def execute():
+        connection = await connect(
+            resource_arn='arn:aws:rds:us-west-2:dummy', secret_arn='dummy'
+        )
+        async with connection:
+            await connection.cursor()
+        return connection
+
+    connection = run(execute())
+    get_session.return_value.create_client.assert_called_once_with(
+        'rds-data', region_name='us-west-2'
+    )
+    assert client_context.exited
+    assert connection.closed
+    mocked_client.commit_transaction.assert_called_once()
+
+
+def test_with_statement_keeps_given_client(mocked_client) -> None:
+    async def execute():
+        connection = await connect(
+            resource_arn='arn:aws:rds:dummy', secret_arn='dummy', client=mocked_client
+        )
+        async with connection:
+            pass
+        return connection
+
+    assert not run(execute()).closed
+
+
+def test_connect_with_resource_name(mocked_client, mocker) -> None:
+    rds_client = mocker.Mock()
+    rds_client.describe_db_clusters = mocked_client.async_method(
+        {'DBClusters': [{'DBClusterArn': 'arn:aws:rds:dummy'}]}
+    )
+
+    async def execute():
+        connection = await connect(
+            resource_name='dummy',
+            secret_arn='dummy',
+            client=mocked_client,
+            rds_client=rds_client,
+        )
+        return await connection.cursor()
+
+    run(execute())
+    rds_client.describe_db_clusters.assert_called_once_with(DBClusterIdentifier='dummy')
+    mocked_client.begin_transaction.assert_called_once_with(
+        resourceArn='arn:aws:rds:dummy', secretArn='dummy'
+    )
+
+
+def test_connect_with_resource_name_default_rds_client(mocked_client, mocker) -> None:
+    rds_client = mocker.Mock()
+    rds_client.describe_db_clusters = mocked_client.async_method(
+        {'DBClusters': [{'DBClusterArn': 'arn:aws:rds:dummy'}]}
+    )
+    client_context = ClientContext(rds_client)
+    get_session = mocker.patch('pydataapi.aio.get_session')
+    get_session.return_value.create_client.return_value = client_context
+
+    run(connect(resource_name='dummy', secret_arn='dummy', client=mocked_client))
+    get_session.return_value.create_client.assert_called_once_with('rds')
+    assert client_context.exited
+
+
+def test_connect_with_resource_name_and_resource_arn(mocked_client) -> None:
+    with pytest.raises(
+        DataAPIError, match='resource_name should be set without resource_arn.'
+    ):
+        run(
+            connect(
+                resource_arn='arn:aws:rds:dummy',
+                resource_name='dummy',
+                secret_arn='dummy',
+                client=mocked_client,
+            )
+        )
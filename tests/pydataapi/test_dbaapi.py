@@ -1,6 +1,7 @@
 import pytest
 
 from pydataapi import connect
+from pydataapi.dbapi import get_description
 
 
 @pytest.fixture
@@ -205,6 +206,29 @@ def test_execute_select_fetch_many(mocked_client, mocker) -> None:
     assert data_api.closed is True
 
 
+def test_execute_select_fetch_mixed(mocked_client) -> None:
+    mocked_client.begin_transaction.return_value = {'transactionId': 'abc'}
+    mocked_client.execute_statement.return_value = {
+        'numberOfRecordsUpdated': 0,
+        'records': [
+            [{'longValue': 1}, {'stringValue': 'cat'}],
+            [{'longValue': 2}, {'stringValue': 'dog'}],
+            [{'longValue': 3}, {'stringValue': 'snake'}],
+        ],
+    }
+    data_api = connect(
+        resource_arn='arn:aws:rds:dummy',
+        secret_arn='dummy',
+        database='test',
+        client=mocked_client,
+    )
+    result = data_api.cursor().execute("select * from pets")
+    assert result.fetchone() == [1, 'cat']
+    assert result.fetchmany(2) == [[2, 'dog'], [3, 'snake']]
+    assert result.fetchmany() == []
+    assert result.fetchall() == []
+
+
 def test_execute_select_iter(mocked_client, mocker) -> None:
     mocked_client.begin_transaction.return_value = {'transactionId': 'abc'}
     mocked_client.execute_statement.return_value = {
@@ -224,8 +248,9 @@ def test_execute_select_iter(mocked_client, mocker) -> None:
     result = data_api.cursor().execute("select * from pets")
     result_iter = iter(result)
     assert next(result_iter) == [1, 'cat']
-    assert next(result_iter) == [2, 'dog']
+    assert result.fetchone() == [2, 'dog']
     assert next(result_iter) == [3, 'snake']
+    assert result.fetchone() is None
     assert mocked_client.execute_statement.call_args == mocker.call(
         continueAfterTimeout=True,
         database='test',
@@ -290,7 +315,8 @@ def test_with_statement(mocked_client) -> None:
         secret_arn='dummy',
         database='test',
         client=mocked_client,
-    ):
+    ) as connection:
+        connection.cursor()
         mocked_client.begin_transaction.assert_called_once_with(
             database='test', resourceArn='arn:aws:rds:dummy', secretArn='dummy'
         )
@@ -299,6 +325,19 @@ def test_with_statement(mocked_client) -> None:
     )
 
 
+def test_with_statement_without_statements(mocked_client) -> None:
+    with connect(
+        resource_arn='arn:aws:rds:dummy',
+        secret_arn='dummy',
+        database='test',
+        client=mocked_client,
+        auto_transaction=False,
+    ):
+        pass
+    mocked_client.begin_transaction.assert_not_called()
+    mocked_client.commit_transaction.assert_not_called()
+
+
 def test_with_statement_exception(mocked_client) -> None:
     mocked_client.begin_transaction.return_value = {'transactionId': 'abc'}
     with pytest.raises(Exception):
@@ -307,7 +346,8 @@ def test_with_statement_exception(mocked_client) -> None:
             secret_arn='dummy',
             database='test',
             client=mocked_client,
-        ):
+        ) as connection:
+            connection.cursor()
             mocked_client.begin_transaction.assert_called_once_with(
                 database='test', resourceArn='arn:aws:rds:dummy', secretArn='dummy'
             )
@@ -329,7 +369,8 @@ def test_with_statement_custom_exception(mocked_client, mocker) -> None:
             database='test',
             client=mocked_client,
             rollback_exception=CustomError,
-        ):
+        ) as connection:
+            connection.cursor()
             mocked_client.begin_transaction.assert_called_once_with(
                 database='test', resourceArn='arn:aws:rds:dummy', secretArn='dummy'
             )
@@ -347,7 +388,8 @@ def test_with_statement_custom_exception(mocked_client, mocker) -> None:
             database='test',
             client=second_mocked_client,
             rollback_exception=CustomError,
-        ):
+        ) as connection:
+            connection.cursor()
             second_mocked_client.begin_transaction.assert_called_once_with(
                 database='test', resourceArn='arn:aws:rds:dummy', secretArn='dummy'
             )
@@ -381,6 +423,9 @@ def test_execute_select_w_auto_transaction(mocked_client, mocker) -> None:
         transactionId='abc',
     )
     mocked_client.begin_transaction.assert_called_once()
+    second = data_api.execute("select * from pets")
+    assert second is not result
+    assert len(data_api.cursors) == 0
 
 
 def test_execute_select_wo_auto_transaction(mocked_client, mocker) -> None:
@@ -409,3 +454,48 @@ def test_execute_select_wo_auto_transaction(mocked_client, mocker) -> None:
         sql='select * from pets',
     )
     mocked_client.begin_transaction.assert_not_called()
+
+
+def test_get_description() -> None:
+    column_metadata = [
+        {'label': 'id', 'type': 4, 'precision': 11, 'scale': 0, 'nullable': 1}
+    ]
+    description = get_description(column_metadata)
+    assert description == (('id', int, 0, 0, 11, 0, 1),)
+    assert get_description([dict(column_metadata[0])])[0] is description[0]
+
+
+def test_executemany_batch_size(mocked_client) -> None:
+    mocked_client.begin_transaction.return_value = {'transactionId': 'abc'}
+    mocked_client.batch_execute_statement.side_effect = [
+        {'updateResults': [{'generatedFields': []}, {'generatedFields': []}]},
+        {'updateResults': [{'generatedFields': [{'longValue': 5}]}]},
+    ]
+    data_api = connect(
+        resource_arn='arn:aws:rds:dummy',
+        secret_arn='dummy',
+        database='test',
+        client=mocked_client,
+    )
+    cursor = data_api.cursor()
+    cursor.batch_size = 2
+    cursor.executemany(
+        "insert into pets values (:id)", [{'id': 3}, {'id': 4}, {'id': 5}]
+    )
+    assert mocked_client.batch_execute_statement.call_count == 2
+    assert cursor.rowcount == 3
+    assert cursor.lastrowid == 5
+    assert cursor.description is None
+
+
+def test_cursors_are_not_retained(mocked_client) -> None:
+    data_api = connect(
+        resource_arn='arn:aws:rds:dummy',
+        secret_arn='dummy',
+        client=mocked_client,
+        auto_transaction=False,
+    )
+    cursor = data_api.cursor()
+    assert list(data_api.cursors) == [cursor]
+    del cursor
+    assert len(data_api.cursors) == 0
@@ -579,3 +579,55 @@ def test_postgresql(mocked_client) -> None:
     pet = Pets(id=3, name='snake', created='2019-11-14 10:20:30')
     session.add(pet)
     session.flush()
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        ('2020-01-02', datetime.datetime(2020, 1, 2)),
+        ('2020-01-02 03:04:05', datetime.datetime(2020, 1, 2, 3, 4, 5)),
+        ('2020-01-02 03:04:05.6', datetime.datetime(2020, 1, 2, 3, 4, 5, 600000)),
+        (
+            '2020-01-02 03:04:05.678912',
+            datetime.datetime(2020, 1, 2, 3, 4, 5, 678912),
+        ),
+        ('x2020-01-02', None),
+        ('2020-W01-1', None),
+        ('20200102T030405', None),
+        ('2020-01-02T03:04:05', None),
+        ('2020-01-02 03:04:05+09', None),
+        ('2020-01-02 03:04:05,678', None),
+        ('2020-01-02 03:04:05.678+09:00', None),
+    ],
+)
+def test_parse_datetime(value, expected) -> None:
+    from pydataapi.dialect.base import _parse_datetime
+
+    assert _parse_datetime(value) == expected
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        ('2020-01-02', datetime.datetime(2020, 1, 2)),
+        ('2020-01-02 03:04:05', datetime.datetime(2020, 1, 2, 3, 4, 5)),
+        (
+            '2020-01-02 03:04:05.678912',
+            datetime.datetime(2020, 1, 2, 3, 4, 5, 678912),
+        ),
+    ],
+)
+def test_parse_datetime_by_pattern(value, expected) -> None:
+    from pydataapi.dialect.base import _parse_datetime_by_pattern
+
+    assert _parse_datetime_by_pattern(value) == expected
+
+
+@pytest.mark.parametrize(
+    'value', ['x2020-01-02', '2020-W01-1', '2020-01-02 03:04:05+09']
+)
+def test_parse_datetime_by_pattern_invalid(value) -> None:
+    from pydataapi.dialect.base import _parse_datetime_by_pattern
+
+    with pytest.raises(ValueError, match='Invalid isoformat string'):
+        _parse_datetime_by_pattern(value)
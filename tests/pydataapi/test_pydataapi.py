@@ -3,7 +3,7 @@ from decimal import Decimal
 from typing import Any, Dict
 
 import pytest
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
 from sqlalchemy import Column, Integer, String
 from sqlalchemy import types as types
 from sqlalchemy.ext.declarative import declarative_base
@@ -15,10 +15,15 @@ from pydataapi.pydataapi import (
     Record,
     Result,
     UpdateResults,
+    _find_arn_by_resource_name,
     _get_value_from_row,
+    _get_values_from_records,
     convert_array_value,
     create_sql_parameter,
+    create_sql_parameter_sets,
     create_sql_parameters,
+    get_rds_client,
+    get_rds_data_client,
     transaction,
 )
 
@@ -63,6 +68,17 @@ def test_create_sql_parameter(input_value: Any, expected: Dict[str, Any]) -> Non
     assert create_sql_parameter('', input_value)['value'] == expected
 
 
+def test_create_sql_parameter_subclass() -> None:
+    class MyInt(int):
+        pass
+
+    class MyStr(str):
+        pass
+
+    assert create_sql_parameter('', MyInt(1))['value'] == {'longValue': 1}
+    assert create_sql_parameter('', MyStr('a'))['value'] == {'stringValue': 'a'}
+
+
 def test_convert_value_other_types() -> None:
     class Dummy:
         def __str__(self):
@@ -122,6 +138,15 @@ def test_convert_array_value(input_value: Any, expected: Dict[str, Any]) -> None
     assert convert_array_value(input_value) == expected
 
 
+def test_convert_array_value_subclass() -> None:
+    class MyInt(int):
+        pass
+
+    assert convert_array_value([MyInt(1), MyInt(2)]) == {
+        'arrayValue': {'longValues': [1, 2]}
+    }
+
+
 def test_convert_arrary_value_fail() -> None:
     class Dummy:
         pass
@@ -135,6 +160,10 @@ def test_convert_arrary_value_fail() -> None:
     [
         ({'arrayValue': {'stringValues': ['str', 'string']}}, ['str', 'string']),
         ({'longValue': 123}, 123),
+        ({'stringValue': 'dog'}, 'dog'),
+        ({'doubleValue': 0.5}, 0.5),
+        ({'booleanValue': False}, False),
+        ({'isNull': True}, None),
         (
             {
                 'arrayValue': {
@@ -152,6 +181,28 @@ def test_get_value_from_row(input_value: Dict[str, Any], expected: Any) -> None:
     assert _get_value_from_row(input_value) == expected
 
 
+def test_get_values_from_records() -> None:
+    assert _get_values_from_records([]) == []
+    assert _get_values_from_records(
+        [
+            [{'longValue': 1}, {'isNull': True}, {'arrayValue': {'longValues': [1]}}],
+            [{'isNull': True}, {'stringValue': 'cat'}, {'isNull': True}],
+            [
+                {'longValue': 3},
+                {'stringValue': 'dog'},
+                {'arrayValue': {'longValues': []}},
+            ],
+        ]
+    ) == [[1, None, [1]], [None, 'cat', None], [3, 'dog', []]]
+    assert _get_values_from_records(
+        [
+            [{'longValue': 1}, {'stringValue': 'dog'}],
+            [{'doubleValue': 0.5}, {'stringValue': 'cat'}],
+            [{'longValue': 2}, {'isNull': True}],
+        ]
+    ) == [[1, 'dog'], [0.5, 'cat'], [2, None]]
+
+
 def test_create_parameters() -> None:
     expected = [
         {'name': 'int', 'value': {'longValue': 1}},
@@ -177,14 +228,36 @@ def test_create_parameters() -> None:
     )
 
 
+def test_create_parameter_sets() -> None:
+    assert create_sql_parameter_sets(
+        [{'id': 1, 'name': 'cat'}, {'id': None, 'name': datetime.date(2020, 1, 2)}]
+    ) == [
+        [
+            {'name': 'id', 'value': {'longValue': 1}},
+            {'name': 'name', 'value': {'stringValue': 'cat'}},
+        ],
+        [
+            {'name': 'id', 'value': {'isNull': True}},
+            {
+                'name': 'name',
+                'value': {'stringValue': '2020-01-02'},
+                'typeHint': 'DATE',
+            },
+        ],
+    ]
+
+
 def test_record() -> None:
     record = Record([1, 'dog'], ['id', 'name'])
     assert str(record) == '<Record(id=1, name=dog)>'
     assert record.headers == ['id', 'name']
-    assert next(record) == 1
-    assert next(record) == 'dog'
+    assert list(record) == [1, 'dog']
+    values = iter(record)
+    assert next(values) == 1
+    assert next(values) == 'dog'
     with pytest.raises(StopIteration):
-        next(record)
+        next(values)
+    assert list(record) == [1, 'dog']
 
     assert record.dict() == {'id': 1, 'name': 'dog'}
 
@@ -250,26 +323,38 @@ def test_result() -> None:
         }
     )
 
+    assert len(result) == 3
+    assert result.headers == ['id', 'name']
     assert result[0] == [1, 'dog']
     assert result[1] == [2, 'cat']
     assert result[2] == [3, None]
+    assert result._decoded_rows is None
     dog, cat, none = result[0:3]
     assert dog == [1, 'dog']
     assert cat == [2, 'cat']
     assert none == [3, None]
-    assert next(result) == Record([1, 'dog'], ['id', 'name'])
-    assert next(result) == Record([2, 'cat'], ['id', 'name'])
-    assert next(result) == Record([3, None], ['id', 'name'])
+    records = iter(result)
+    assert next(records) == Record([1, 'dog'], ['id', 'name'])
+    assert next(records) == Record([2, 'cat'], ['id', 'name'])
+    assert next(records) == Record([3, None], ['id', 'name'])
     with pytest.raises(StopIteration):
-        next(result)
+        next(records)
 
+    assert [record.dict() for record in result] == [
+        {'id': 1, 'name': 'dog'},
+        {'id': 2, 'name': 'cat'},
+        {'id': 3, 'name': None},
+    ]
     assert result.all() == [
         Record([1, 'dog'], ['id', 'name']),
         Record([2, 'cat'], ['id', 'name']),
         Record([3, None], ['id', 'name']),
     ]
+    assert result.columns() == {'id': [1, 2, 3], 'name': ['dog', 'cat', None]}
     assert result.first() == Record([1, 'dog'], ['id', 'name'])
-    with pytest.raises(MultipleResultsFound):
+    with pytest.raises(
+        MultipleResultsFound, match=r'Multiple rows were found for one\(\)'
+    ):
         result.one()
 
     with pytest.raises(MultipleResultsFound):
@@ -289,10 +374,11 @@ def test_result() -> None:
     result_empty = Result(
         {'numberOfRecordsUpdated': 0, 'records': [], "columnMetadata": column_metadata}
     )
-    with pytest.raises(NoResultFound):
+    with pytest.raises(NoResultFound, match=r'No row was found for one\(\)'):
         result_empty.one()
     assert result_empty.one_or_none() is None
     assert result_empty.first() is None
+    assert result_empty.columns() == {'id': [], 'name': []}
 
 
 def test_generated_fields_first() -> None:
@@ -354,6 +440,7 @@ def test_update_results() -> None:
     assert update_results[2].generated_fields == [7, 8, 9]
     assert update_results[2].generated_fields_first == 7
     assert update_results[0:1] == [GeneratedFields([{'1': 1}, {'2': 2}, {'3': 3}])]
+    assert [r.generated_fields_first for r in update_results] == [1, 4, 7]
 
     empty = UpdateResults([{'generatedFields': []}])
     assert len(empty) == 1
@@ -369,6 +456,19 @@ def test_client(mocker) -> None:
     assert data_api.client == mock_client
 
 
+def test_get_rds_data_client(mocked_client) -> None:
+    get_rds_data_client.cache_clear()
+    try:
+        data_api = DataAPI(
+            resource_arn='arn:aws:rds:us-west-2:123456789012:cluster:dummy',
+            secret_arn='dummy',
+        )
+        assert data_api.client is get_rds_data_client('us-west-2')
+        mocked_client.assert_called_once_with('rds-data', region_name='us-west-2')
+    finally:
+        get_rds_data_client.cache_clear()
+
+
 def test_resource_arn(mocker, mocked_client) -> None:
     mock_client = mocker.Mock()
     mock_client.describe_db_clusters.return_value = {
@@ -384,10 +484,24 @@ def test_resource_arn(mocker, mocked_client) -> None:
 
     mocked_client.return_value = mock_client
 
-    data_api: DataAPI = DataAPI(
-        resource_name='dummy', secret_arn='dummy', client=mock_client
-    )
-    assert data_api.resource_arn == 'arn:aws:rds:dummy'
+    get_rds_client.cache_clear()
+    _find_arn_by_resource_name.cache_clear()
+    try:
+        data_api: DataAPI = DataAPI(
+            resource_name='dummy', secret_arn='dummy', client=mock_client
+        )
+        assert data_api.resource_arn == 'arn:aws:rds:dummy'
+        assert get_rds_client() is mock_client
+        mocked_client.assert_called_once_with('rds')
+
+        data_api = DataAPI(
+            resource_name='dummy', secret_arn='dummy', client=mock_client
+        )
+        assert data_api.resource_arn == 'arn:aws:rds:dummy'
+        assert mock_client.describe_db_clusters.call_count == 2
+    finally:
+        get_rds_client.cache_clear()
+        _find_arn_by_resource_name.cache_clear()
 
 
 def test_not_found_resource_arn_and_resource_arn(mocker, mocked_client) -> None:
@@ -746,6 +860,36 @@ def test_execute_insert_parameter_set(mocked_client, mocker) -> None:
     )
 
 
+def test_execute_insert_parameter_set_generator(mocked_client, mocker) -> None:
+    mocked_client.batch_execute_statement.side_effect = [
+        {'updateResults': [{'generatedFields': [{'longValue': 3}]}]},
+        {'updateResults': [{'generatedFields': [{'longValue': 4}]}]},
+    ]
+
+    data_api = DataAPI(
+        resource_arn='arn:aws:rds:dummy',
+        secret_arn='dummy',
+        client=mocked_client,
+        transaction_id='12345',
+    )
+    results = data_api.batch_execute(
+        "insert into test.pets  values (:id)",
+        ({'id': id_} for id_ in (3, 4)),
+        batch_size=1,
+    )
+    assert [r.generated_fields_first for r in results] == [3, 4]
+    assert mocked_client.batch_execute_statement.call_args_list == [
+        mocker.call(
+            resourceArn='arn:aws:rds:dummy',
+            secretArn='dummy',
+            sql="insert into test.pets  values (:id)",
+            parameterSets=[[{'name': 'id', 'value': {'longValue': id_}}]],
+            transactionId='12345',
+        )
+        for id_ in (3, 4)
+    ]
+
+
 def test_execute_insert_parameter_set_invalid_1(mocked_client, mocker) -> None:
     mocked_client.batch_execute_statement.side_effect = Exception('Invalid Request')
 
@@ -772,10 +916,34 @@ def test_execute_insert_parameter_set_invalid_2(mocked_client, mocker) -> None:
         client=mocked_client,
     )
 
-    with pytest.raises(ValidationError):
+    mocked_client.begin_transaction.return_value = {'transactionId': 'abc'}
+
+    with pytest.raises(AttributeError):
         data_api.batch_execute(
             "insert into test.pets  values (:id , :name)", {'id': 3, 'name': 'bird'}
         )
+    mocked_client.batch_execute_statement.assert_not_called()
+    mocked_client.rollback_transaction.assert_called_once_with(
+        resourceArn='arn:aws:rds:dummy', secretArn='dummy', transactionId='abc'
+    )
+
+
+@pytest.mark.parametrize('batch_size', [0, -1])
+def test_batch_execute_invalid_batch_size(mocked_client, batch_size) -> None:
+    data_api = DataAPI(
+        resource_arn='arn:aws:rds:dummy',
+        secret_arn='dummy',
+        database='test',
+        client=mocked_client,
+    )
+
+    with pytest.raises(DataAPIError, match='batch_size must be greater than 0'):
+        data_api.batch_execute(
+            "insert into test.pets  values (:id)", [{'id': 3}], batch_size=batch_size
+        )
+    mocked_client.begin_transaction.assert_not_called()
+    mocked_client.batch_execute_statement.assert_not_called()
+    mocked_client.commit_transaction.assert_not_called()
 
 
 def test_transaction_add_user(mocked_client):